@@ -4,10 +4,15 @@ Tests RuntimeCache and AsyncRuntimeCache using the in-memory fallback
 when cache environment variables are not set.
 """
 
+from datetime import datetime, timezone
+
 import httpx
 import pytest
+import time_machine
 from respx import MockRouter
 
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class TestBuildCacheStrictErrors:
     def test_strict_set_raises_for_non_200(self, respx_mock: MockRouter) -> None:
@@ -338,53 +343,49 @@ class TestSyncAsyncParity:
 class TestCacheTagOperations:
     """Test cache tag-based operations."""
 
-    def test_expire_tag_sync(self, mock_env_clear):
+    @pytest.mark.parametrize(
+        ("entries", "expire", "survivors"),
+        [
+            (
+                [
+                    ("tagged1", "value1", ["tag1", "tag2"]),
+                    ("tagged2", "value2", ["tag1"]),
+                    ("untagged", "value3", None),
+                ],
+                "tag1",
+                {"untagged": "value3"},
+            ),
+            (
+                [
+                    ("tagged_a", "value_a", ["tag_a"]),
+                    ("tagged_b", "value_b", ["tag_b"]),
+                    ("tagged_both", "value_both", ["tag_a", "tag_b"]),
+                ],
+                ["tag_a", "tag_b"],
+                {},
+            ),
+            (
+                [("kept", "value_kept", ["keep"])],
+                "other_tag",
+                {"kept": "value_kept"},
+            ),
+        ],
+        ids=["single-tag", "tag-list", "no-match"],
+    )
+    def test_expire_tag_sync(self, mock_env_clear, entries, expire, survivors):
         """Test expiring cache entries by tag (sync)."""
         from vercel.cache import get_cache
 
         cache = get_cache()
 
-        # Set values with tags
-        cache.set("tagged1", "value1", {"tags": ["tag1", "tag2"]})
-        cache.set("tagged2", "value2", {"tags": ["tag1"]})
-        cache.set("untagged", "value3")  # No tag1
-
-        # Verify entries exist before expiring
-        assert cache.get("tagged1") == "value1"
-        assert cache.get("tagged2") == "value2"
-        assert cache.get("untagged") == "value3"
-
-        # Expire by tag - should remove entries with tag1
-        cache.expire_tag("tag1")
-
-        # Entries with tag1 should be expired
-        assert cache.get("tagged1") is None
-        assert cache.get("tagged2") is None
-        # Entry without tag1 should still exist
-        assert cache.get("untagged") == "value3"
-
-    def test_expire_tag_list(self, mock_env_clear):
-        """Test expiring cache entries by multiple tags."""
-        from vercel.cache import get_cache
-
-        cache = get_cache()
-
-        cache.set("tagged_a", "value_a", {"tags": ["tag_a"]})
-        cache.set("tagged_b", "value_b", {"tags": ["tag_b"]})
-        cache.set("tagged_both", "value_both", {"tags": ["tag_a", "tag_b"]})
-
-        # Verify entries exist
-        assert cache.get("tagged_a") == "value_a"
-        assert cache.get("tagged_b") == "value_b"
-        assert cache.get("tagged_both") == "value_both"
+        for key, value, tags in entries:
+            cache.set(key, value, {"tags": tags} if tags else None)
+            assert cache.get(key) == value
 
-        # Expire by multiple tags
-        cache.expire_tag(["tag_a", "tag_b"])
+        cache.expire_tag(expire)
 
-        # All tagged entries should be expired
-        assert cache.get("tagged_a") is None
-        assert cache.get("tagged_b") is None
-        assert cache.get("tagged_both") is None
+        for key, _, _ in entries:
+            assert cache.get(key) == survivors.get(key)
 
     @pytest.mark.asyncio
     async def test_expire_tag_async(self, mock_env_clear):
@@ -426,6 +427,44 @@ class TestCacheWithOptions:
 
         cache.delete("ttl_key")
 
+    def test_get_returns_none_after_ttl_expires(self, mock_env_clear):
+        """Test entries expire once the clock passes their TTL, without sleeping."""
+        from vercel.cache import get_cache
+
+        cache = get_cache()
+
+        with time_machine.travel(NOW, tick=False) as clock:
+            cache.set("ttl_key", "ttl_value", {"ttl": 60})
+            clock.shift(59)
+            assert cache.get("ttl_key") == "ttl_value"
+            clock.shift(2)
+            assert cache.get("ttl_key") is None
+
+    def test_contains_false_after_ttl_expires(self, mock_env_clear):
+        """Test membership checks honour TTL expiry."""
+        from vercel.cache import get_cache
+
+        cache = get_cache()
+
+        with time_machine.travel(NOW, tick=False) as clock:
+            cache.set("ttl_key", "ttl_value", {"ttl": 1})
+            assert "ttl_key" in cache
+            clock.shift(2)
+            assert "ttl_key" not in cache
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_async(self, mock_env_clear):
+        """Test async reads honour TTL expiry."""
+        from vercel.cache import AsyncRuntimeCache
+
+        cache = AsyncRuntimeCache()
+
+        with time_machine.travel(NOW, tick=False) as clock:
+            await cache.set("async_ttl_key", "ttl_value", {"ttl": 1})
+            assert await cache.contains("async_ttl_key")
+            clock.shift(2)
+            assert await cache.get("async_ttl_key") is None
+
     def test_set_with_tags_option(self, mock_env_clear):
         """Test setting cache with tags option."""
         from vercel.cache import get_cache
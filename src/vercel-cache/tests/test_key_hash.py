@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import pytest
+
+from vercel.cache.utils import create_key_transformer, default_key_hash_function
+
+
+class TestDefaultKeyHashFunction:
+    # Keys are shared with the TypeScript runtime cache client, so the output must
+    # match its defaultKeyHashFunction exactly.
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [("", "1505"), ("a", "2b5c4"), ("user:123", "8d0276de")],
+    )
+    def test_matches_typescript_client(self, key: str, expected: str) -> None:
+        assert default_key_hash_function(key) == expected
+
+
+class TestCreateKeyTransformer:
+    def test_without_namespace_returns_hash_function(self) -> None:
+        assert create_key_transformer(None, None, None) is default_key_hash_function
+
+    @pytest.mark.parametrize(("sep", "expected"), [(None, "ns$raw"), ("::", "ns::raw")])
+    def test_prefixes_namespace(self, sep: str | None, expected: str) -> None:
+        make_key = create_key_transformer(lambda key: key, "ns", sep)
+        assert make_key("raw") == expected
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Sequence
 
 from vercel.internal.telemetry import track
@@ -18,10 +19,7 @@ class InMemoryCache(Cache):
             track("cache_get", hit=False)
             return None
         ttl = entry.get("ttl")
-        if (
-            ttl is not None
-            and entry["last_modified"] + ttl * 1000 < __import__("time").time() * 1000
-        ):
+        if ttl is not None and entry["last_modified"] + ttl * 1000 < time.time() * 1000:
             self.delete(key)
             # Track cache miss (expired)
             track("cache_get", hit=False)
@@ -31,15 +29,13 @@ class InMemoryCache(Cache):
         return entry["value"]
 
     def set(self, key: str, value: object, options: dict | None = None) -> None:
-        from time import time
-
         opts = options or {}
         ttl = opts.get("ttl")
         tags = set(opts.get("tags", []))
         self._cache[key] = {
             "value": value,
             "tags": tags,
-            "last_modified": int(time() * 1000),
+            "last_modified": int(time.time() * 1000),
             "ttl": ttl,
         }
         # Track telemetry
@@ -63,10 +59,7 @@ class InMemoryCache(Cache):
         if not entry:
             return False
         ttl = entry.get("ttl")
-        if (
-            ttl is not None
-            and entry["last_modified"] + ttl * 1000 < __import__("time").time() * 1000
-        ):
+        if ttl is not None and entry["last_modified"] + ttl * 1000 < time.time() * 1000:
             # Expired entries should not be considered present
             self.delete(key)
             return False
@@ -17,11 +17,12 @@ def create_key_transformer(
     sep: str | None,
 ) -> Callable[[str], str]:
     key_fn = key_fn or default_key_hash_function
-    sep = sep or _DEFAULT_NAMESPACE_SEPARATOR
+    if not ns:
+        return key_fn
+    # Resolve the namespace prefix once so each key only pays for one concatenation.
+    prefix = f"{ns}{sep or _DEFAULT_NAMESPACE_SEPARATOR}"
 
     def make(key: str) -> str:
-        if not ns:
-            return key_fn(key)
-        return f"{ns}{sep}{key_fn(key)}"
+        return prefix + key_fn(key)
 
     return make
@@ -1,3 +1,6 @@
+from collections.abc import Coroutine
+from typing import Any
+
 import pytest
 
 from vercel._internal.core.iter_coroutine import iter_coroutine
@@ -9,6 +12,25 @@ class _SuspendingAwaitable:
         return None
 
 
+class _CountingCoroutine(Coroutine[Any, Any, Any]):
+    def __init__(self, coro: Coroutine[Any, Any, Any]) -> None:
+        self._coro = coro
+        self.sends = 0
+
+    def send(self, value: Any) -> Any:
+        self.sends += 1
+        return self._coro.send(value)
+
+    def throw(self, *args: Any) -> Any:
+        return self._coro.throw(*args)
+
+    def close(self) -> None:
+        self._coro.close()
+
+    def __await__(self) -> Any:
+        return self._coro.__await__()
+
+
 def test_iter_coroutine_returns_result_and_closes_coroutine() -> None:
     closed = False
 
@@ -37,3 +59,13 @@ def test_iter_coroutine_raises_on_suspending_coroutine_and_closes_coroutine() ->
         iter_coroutine(coro())
 
     assert closed
+
+
+def test_iter_coroutine_uses_single_send() -> None:
+    async def coro() -> str:
+        return "ok"
+
+    counting = _CountingCoroutine(coro())
+
+    assert iter_coroutine(counting) == "ok"
+    assert counting.sends == 1
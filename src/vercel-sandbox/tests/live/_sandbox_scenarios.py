@@ -6,7 +6,7 @@ import subprocess
 import tempfile
 import time
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
@@ -30,7 +30,9 @@ from vercel.sandbox import (
 )
 
 _SESSION_STOP_TIMEOUT_SECONDS = 60
-_SESSION_STOP_POLL_INTERVAL_SECONDS = 0.5
+_SESSION_STOP_POLL_INITIAL_INTERVAL_SECONDS = 0.1
+_SESSION_STOP_POLL_MAX_INTERVAL_SECONDS = 2.0
+_SESSION_STOP_POLL_BACKOFF_FACTOR = 1.7
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,6 +71,7 @@ class ProcessFilesystemObservation:
     missing_executable_failed: bool
     text: str
     binary: bytes
+    batched_texts: tuple[str, ...]
     missing_read_failed: bool
     invalid_write_failed: bool
 
@@ -92,7 +95,7 @@ class NetworkPolicyObservation:
 
 class _ScenarioDriver:
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[None]:
+    async def session(self, *, scoped: bool = False) -> AsyncIterator[None]:
         raise NotImplementedError
         yield
 
@@ -218,8 +221,13 @@ class _ScenarioDriver:
 
 class AsyncDriver(_ScenarioDriver):
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[None]:
-        async with session():
+    async def session(self, *, scoped: bool = False) -> AsyncIterator[None]:
+        if scoped:
+            async with session():
+                yield
+        else:
+            # Unscoped flows run on the process-wide default session, which keeps
+            # one connection pool per event loop across flows.
             yield
 
     @asynccontextmanager
@@ -396,10 +404,15 @@ class AsyncDriver(_ScenarioDriver):
             runtime_session = resumed.current_session
             assert runtime_session is not None
         deadline = time.monotonic() + _SESSION_STOP_TIMEOUT_SECONDS
+        interval = _SESSION_STOP_POLL_INITIAL_INTERVAL_SECONDS
         while runtime_session.status is not SandboxStatus.STOPPED:
             if time.monotonic() >= deadline:
                 return output, exit_code, False
-            await asyncio.sleep(_SESSION_STOP_POLL_INTERVAL_SECONDS)
+            await asyncio.sleep(interval)
+            interval = min(
+                interval * _SESSION_STOP_POLL_BACKOFF_FACTOR,
+                _SESSION_STOP_POLL_MAX_INTERVAL_SECONDS,
+            )
             await runtime_session.refresh()
         return output, exit_code, True
 
@@ -412,8 +425,12 @@ class AsyncDriver(_ScenarioDriver):
 
 class SyncDriver(_ScenarioDriver):
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[None]:
-        with session():
+    async def session(self, *, scoped: bool = False) -> AsyncIterator[None]:
+        if scoped:
+            with session():
+                yield
+        else:
+            # Unscoped flows share the default session's client and keep-alive pool.
             yield
 
     @asynccontextmanager
@@ -583,10 +600,15 @@ class SyncDriver(_ScenarioDriver):
             runtime_session = resumed.current_session
             assert runtime_session is not None
         deadline = time.monotonic() + _SESSION_STOP_TIMEOUT_SECONDS
+        interval = _SESSION_STOP_POLL_INITIAL_INTERVAL_SECONDS
         while runtime_session.status is not SandboxStatus.STOPPED:
             if time.monotonic() >= deadline:
                 return output, exit_code, False
-            await asyncio.sleep(_SESSION_STOP_POLL_INTERVAL_SECONDS)
+            await asyncio.sleep(interval)
+            interval = min(
+                interval * _SESSION_STOP_POLL_BACKOFF_FACTOR,
+                _SESSION_STOP_POLL_MAX_INTERVAL_SECONDS,
+            )
             runtime_session.refresh()
         return output, exit_code, True
 
@@ -599,7 +621,8 @@ class SyncDriver(_ScenarioDriver):
 
 async def workspace_command_flow(driver: _ScenarioDriver, name: str) -> WorkspaceObservation:
     context_cleaned_up = False
-    async with driver.session():
+    # Keep one flow on an explicitly scoped session() to cover that public entry point.
+    async with driver.session(scoped=True):
         async with driver.ephemeral_sandbox(name) as box:
             await driver.mkdir(box, "workspace")
             await driver.write_files(
@@ -648,38 +671,50 @@ async def workspace_command_flow(driver: _ScenarioDriver, name: str) -> Workspac
     )
 
 
-async def process_filesystem_flow(
+async def shared_sandbox_flow(
     driver: _ScenarioDriver, name: str
-) -> ProcessFilesystemObservation:
+) -> tuple[ProcessFilesystemObservation, StreamingTransferObservation]:
+    """Run the lifecycle-agnostic checks against one sandbox instead of one each."""
     async with driver.session():
         async with driver.ephemeral_sandbox(name) as box:
-            await driver.write_text(box, "message.txt", "hello\n")
-            await driver.write_bytes(box, "data.bin", b"\x00\xff")
+            process_filesystem = await _process_filesystem_checks(driver, box)
+            streaming_transfer = await _streaming_transfer_checks(driver, box)
+    return process_filesystem, streaming_transfer
 
-            process = await driver.create_process(
-                box,
-                "python",
-                [
-                    "-c",
-                    "import sys; print('stdout line'); print('stderr line', file=sys.stderr); "
-                    "raise SystemExit(3)",
-                ],
-            )
-            stdout, stderr = await driver.read_process_streams(process)
-            returncode = await driver.wait(process)
 
-            sleeper = await driver.create_process(box, "sleep", ["60"])
-            await driver.terminate(sleeper)
-            terminated_returncode = await driver.wait(sleeper)
+async def _process_filesystem_checks(
+    driver: _ScenarioDriver, box: Any
+) -> ProcessFilesystemObservation:
+    await driver.write_text(box, "message.txt", "hello\n")
+    await driver.write_bytes(box, "data.bin", b"\x00\xff")
+    batched_files = [(f"batched/file-{index}.txt", f"batched {index}\n") for index in range(3)]
+    await driver.write_files(box, batched_files)
+
+    process = await driver.create_process(
+        box,
+        "python",
+        [
+            "-c",
+            "import sys; print('stdout line'); print('stderr line', file=sys.stderr); "
+            "raise SystemExit(3)",
+        ],
+    )
+    stdout, stderr = await driver.read_process_streams(process)
+    returncode = await driver.wait(process)
+
+    sleeper = await driver.create_process(box, "sleep", ["60"])
+    await driver.terminate(sleeper)
+    terminated_returncode = await driver.wait(sleeper)
 
-            timed = await driver.create_process(box, "sleep", ["60"], kill_after=2.5)
-            timed_out_returncode = await driver.wait(timed)
+    timed = await driver.create_process(box, "sleep", ["60"], kill_after=2.5)
+    timed_out_returncode = await driver.wait(timed)
 
-            text = await driver.read_text(box, "message.txt")
-            binary = await driver.read_bytes(box, "data.bin")
-            missing_read_failed = await driver.missing_read_failed(box)
-            invalid_write_failed = await driver.invalid_write_failed(box)
-            missing_executable_failed = await driver.missing_executable_failed(box)
+    text = await driver.read_text(box, "message.txt")
+    binary = await driver.read_bytes(box, "data.bin")
+    batched_texts = tuple([await driver.read_text(box, path) for path, _ in batched_files])
+    missing_read_failed = await driver.missing_read_failed(box)
+    invalid_write_failed = await driver.invalid_write_failed(box)
+    missing_executable_failed = await driver.missing_executable_failed(box)
 
     assert returncode is not None
     assert terminated_returncode is not None
@@ -693,13 +728,14 @@ async def process_filesystem_flow(
         missing_executable_failed=missing_executable_failed,
         text=text,
         binary=binary,
+        batched_texts=batched_texts,
         missing_read_failed=missing_read_failed,
         invalid_write_failed=invalid_write_failed,
     )
 
 
-async def streaming_transfer_flow(
-    driver: _ScenarioDriver, name: str
+async def _streaming_transfer_checks(
+    driver: _ScenarioDriver, box: Any
 ) -> StreamingTransferObservation:
     payload = bytes(range(256)) * 1025
     expected_digest = hashlib.sha256(payload).digest()
@@ -714,37 +750,35 @@ async def streaming_transfer_flow(
         source.write_bytes(payload)
         empty_source.write_bytes(b"")
 
-        async with driver.session():
-            async with driver.ephemeral_sandbox(name) as box:
+        try:
+            await driver.write_path(box, remote_paths[0], source, mode=0o600)
+            await driver.write_path(box, remote_paths[1], empty_source)
+            copied = await driver.read_path(box, remote_paths[0], target)
+            empty_copied = await driver.read_path(box, remote_paths[1], empty_target)
+
+            command = await driver.create_process(
+                box,
+                "python",
+                [
+                    "-c",
+                    "import os; print(oct(os.stat('large.bin').st_mode & 0o777))",
+                ],
+            )
+            stdout, _ = await driver.read_process_streams(command)
+            await driver.wait(command)
+
+            try:
+                await driver.read_path(box, "missing.bin", missing_target)
+            except SandboxPathNotFoundError:
+                missing_download_failed = True
+            else:
+                missing_download_failed = False
+        finally:
+            for remote_path in remote_paths:
                 try:
-                    await driver.write_path(box, remote_paths[0], source, mode=0o600)
-                    await driver.write_path(box, remote_paths[1], empty_source)
-                    copied = await driver.read_path(box, remote_paths[0], target)
-                    empty_copied = await driver.read_path(box, remote_paths[1], empty_target)
-
-                    command = await driver.create_process(
-                        box,
-                        "python",
-                        [
-                            "-c",
-                            "import os; print(oct(os.stat('large.bin').st_mode & 0o777))",
-                        ],
-                    )
-                    stdout, _ = await driver.read_process_streams(command)
-                    await driver.wait(command)
-
-                    try:
-                        await driver.read_path(box, "missing.bin", missing_target)
-                    except SandboxPathNotFoundError:
-                        missing_download_failed = True
-                    else:
-                        missing_download_failed = False
-                finally:
-                    for remote_path in remote_paths:
-                        try:
-                            await driver.remove(box, remote_path)
-                        except SandboxPathNotFoundError:
-                            pass
+                    await driver.remove(box, remote_path)
+                except SandboxPathNotFoundError:
+                    pass
 
         return StreamingTransferObservation(
             digest_matches=(
@@ -758,7 +792,6 @@ async def streaming_transfer_flow(
 
 
 async def network_policy_flow(driver: _ScenarioDriver, name: str) -> NetworkPolicyObservation:
-    box = None
     allow_all_created = False
     custom_returned = False
     header_names_redacted = False
@@ -780,8 +813,9 @@ async def network_policy_flow(driver: _ScenarioDriver, name: str) -> NetworkPoli
     )
 
     async with driver.session():
-        try:
+        async with AsyncExitStack() as cleanup:
             box = await driver.create_with_network_policy(name, NetworkPolicy.allow_all())
+            cleanup.push_async_callback(driver.destroy, box)
             allow_all_created = box.network_policy == NetworkPolicy.allow_all()
 
             session = await driver.update_network_policy(box, custom)
@@ -807,10 +841,7 @@ async def network_policy_flow(driver: _ScenarioDriver, name: str) -> NetworkPoli
 
             session = await driver.update_network_policy(box, NetworkPolicy.deny_all())
             deny_all_returned = session.network_policy == NetworkPolicy.deny_all()
-        finally:
-            if box is not None:
-                await driver.destroy(box)
-            cleanup_complete = True
+        cleanup_complete = True
 
     return NetworkPolicyObservation(
         allow_all_created=allow_all_created,
@@ -822,16 +853,14 @@ async def network_policy_flow(driver: _ScenarioDriver, name: str) -> NetworkPoli
 
 
 async def persistent_snapshot_flow(driver: _ScenarioDriver, name: str) -> PersistentObservation:
-    base = None
-    restored = None
-    snapshot = None
     cleanup_complete = False
     tags = {"scenario": "standalone-live"}
     updated_tags = {**tags, "updated": "true"}
 
     async with driver.session():
-        try:
+        async with AsyncExitStack() as cleanup:
             base = await driver.create_persistent(name, tags)
+            cleanup.push_async_callback(driver.destroy, base)
             routes = base.routes
             project_id = base.project_id
             current_session = base.current_session
@@ -851,28 +880,19 @@ async def persistent_snapshot_flow(driver: _ScenarioDriver, name: str) -> Persis
             found = next((item for item in discovered if item.name == name), None)
 
             snapshot = await driver.snapshot(base)
+            cleanup.push_async_callback(driver.delete_snapshot, snapshot)
             fetched = await driver.get_snapshot(snapshot.id)
             listed = await driver.query_snapshots(name)
 
             restored = await driver.restore(f"{name}-restored", snapshot.id)
+            cleanup.push_async_callback(driver.destroy, restored)
             restored_content = await driver.read_text(restored, "state/message.txt")
             (
                 session_output,
                 session_exit_code,
                 session_cleaned_up,
             ) = await driver.run_independent_session(base)
-        finally:
-            try:
-                if snapshot is not None:
-                    await driver.delete_snapshot(snapshot)
-            finally:
-                try:
-                    if restored is not None:
-                        await driver.destroy(restored)
-                finally:
-                    if base is not None:
-                        await driver.destroy(base)
-            cleanup_complete = True
+        cleanup_complete = True
 
     return PersistentObservation(
         discovered=found is not None,
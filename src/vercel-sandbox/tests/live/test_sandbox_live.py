@@ -3,6 +3,7 @@
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 
 from ._sandbox_scenarios import (
     AsyncDriver,
@@ -14,12 +15,13 @@ from ._sandbox_scenarios import (
     WorkspaceObservation,
     network_policy_flow,
     persistent_snapshot_flow,
-    process_filesystem_flow,
-    streaming_transfer_flow,
+    shared_sandbox_flow,
     workspace_command_flow,
 )
 from .conftest import requires_sandbox_credentials
 
+pytestmark = [pytest.mark.live, requires_sandbox_credentials]
+
 
 def _name(scenario: str, mode: str) -> str:
     return f"vercel-py-sandbox-{scenario}-{mode}-{uuid4().hex[:10]}"
@@ -62,6 +64,7 @@ def _assert_process_filesystem(result: ProcessFilesystemObservation) -> None:
     assert result.missing_executable_failed
     assert result.text == "hello\n"
     assert result.binary == b"\x00\xff"
+    assert result.batched_texts == ("batched 0\n", "batched 1\n", "batched 2\n")
     assert result.missing_read_failed
     assert result.invalid_write_failed
 
@@ -76,8 +79,6 @@ def _assert_network_policy(result: NetworkPolicyObservation) -> None:
     )
 
 
-@requires_sandbox_credentials
-@pytest.mark.live
 @pytest.mark.asyncio
 async def test_workspace_command_flow_has_sync_async_semantic_parity() -> None:
     async_result = await workspace_command_flow(AsyncDriver(), _name("workspace", "async"))
@@ -88,35 +89,46 @@ async def test_workspace_command_flow_has_sync_async_semantic_parity() -> None:
     assert async_result == sync_result
 
 
-@requires_sandbox_credentials
-@pytest.mark.live
-@pytest.mark.asyncio
-async def test_process_filesystem_flow_has_sync_async_semantic_parity() -> None:
-    async_result = await process_filesystem_flow(AsyncDriver(), _name("process-fs", "async"))
-    sync_result = await process_filesystem_flow(SyncDriver(), _name("process-fs", "sync"))
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_sandbox_observations() -> dict[
+    str, tuple[ProcessFilesystemObservation, StreamingTransferObservation]
+]:
+    """Run the lifecycle-agnostic flows once per driver on a single shared sandbox.
+
+    Flows that assert on sandbox creation or cleanup keep their own sandboxes.
+    Consumers share the ``shared-sandbox`` xdist group so one worker owns it.
+    """
+    return {
+        "async": await shared_sandbox_flow(AsyncDriver(), _name("shared", "async")),
+        "sync": await shared_sandbox_flow(SyncDriver(), _name("shared", "sync")),
+    }
+
+
+@pytest.mark.xdist_group("shared-sandbox")
+def test_process_filesystem_flow_has_sync_async_semantic_parity(
+    shared_sandbox_observations,
+) -> None:
+    async_result, _ = shared_sandbox_observations["async"]
+    sync_result, _ = shared_sandbox_observations["sync"]
 
     _assert_process_filesystem(async_result)
     _assert_process_filesystem(sync_result)
 
 
-@requires_sandbox_credentials
-@pytest.mark.live
-@pytest.mark.asyncio
-async def test_streaming_transfer_flow() -> None:
+@pytest.mark.xdist_group("shared-sandbox")
+def test_streaming_transfer_flow(shared_sandbox_observations) -> None:
     expected = StreamingTransferObservation(
         digest_matches=True,
         empty_matches=True,
         explicit_mode="0o600",
         missing_download_failed=True,
     )
-    async_result = await streaming_transfer_flow(AsyncDriver(), _name("transfer", "async"))
-    sync_result = await streaming_transfer_flow(SyncDriver(), _name("transfer", "sync"))
+    _, async_result = shared_sandbox_observations["async"]
+    _, sync_result = shared_sandbox_observations["sync"]
     assert async_result == expected
     assert sync_result == expected
 
 
-@requires_sandbox_credentials
-@pytest.mark.live
 @pytest.mark.asyncio
 async def test_network_policy_flow_has_sync_async_semantic_parity() -> None:
     async_result = await network_policy_flow(AsyncDriver(), _name("network-policy", "async"))
@@ -127,8 +139,6 @@ async def test_network_policy_flow_has_sync_async_semantic_parity() -> None:
     assert async_result == sync_result
 
 
-@requires_sandbox_credentials
-@pytest.mark.live
 @pytest.mark.asyncio
 async def test_persistent_snapshot_flow_has_sync_async_semantic_parity() -> None:
     async_result = await persistent_snapshot_flow(AsyncDriver(), _name("persist", "async"))
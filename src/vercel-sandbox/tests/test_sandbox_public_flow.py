@@ -1124,6 +1124,36 @@ async def test_session_closure_during_create_polling_is_rejected(mock_env_clear:
             await operation
 
 
+@respx.mock
+async def test_create_polling_backs_off_until_running(
+    mock_env_clear: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    respx.post("https://sandbox.test/v3/sandboxes").mock(
+        return_value=httpx.Response(
+            200,
+            json=_sandbox_response(status="pending", session_status="pending"),
+        )
+    )
+    respx.get("https://sandbox.test/v2/sandboxes/preview").mock(
+        side_effect=[
+            httpx.Response(200, json=_sandbox_response(status="pending")) for _ in range(7)
+        ]
+        + [httpx.Response(200, json=_sandbox_response())]
+    )
+    delays: list[float] = []
+
+    async def record_sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    async with session(service_options=_session_options()):
+        active_session = get_active_session()
+        monkeypatch.setattr(active_session, "sleep", record_sleep)
+        state = await get_sandbox_service(active_session).create_sandbox(name="preview")
+
+    assert state.name == "preview"
+    assert delays == pytest.approx([0.1, 0.17, 0.289, 0.4913, 0.83521, 1.419857, 2.0, 2.0])
+
+
 @respx.mock
 async def test_query_sandboxes_paginates_and_encodes_filters(mock_env_clear: None) -> None:
     first_page = {
@@ -73,7 +73,9 @@ _TERMINAL_SANDBOX_STATUSES = frozenset(
 _TRANSITIONAL_SANDBOX_STATUSES = frozenset(
     {SandboxStatus.PENDING, SandboxStatus.STOPPING, SandboxStatus.SNAPSHOTTING}
 )
-_READY_POLL_INTERVAL_SECONDS = 0.5
+_READY_POLL_INITIAL_INTERVAL_SECONDS = 0.1
+_READY_POLL_MAX_INTERVAL_SECONDS = 2.0
+_READY_POLL_BACKOFF_FACTOR = 1.7
 AsyncSleep = Callable[[float], Awaitable[None]]
 ProcessOutputCollector = Callable[[ProcessState], Awaitable[tuple[str, str]]]
 _MISSING_PATH_ERROR_CODES = frozenset({"not_found", "path_not_found", "file_not_found", "ENOENT"})
@@ -229,6 +231,7 @@ class SandboxService:
     async def _wait_for_ready_sandbox(
         self, sandbox: SandboxState, *, project_id: str | None = None
     ) -> SandboxState:
+        interval = _READY_POLL_INITIAL_INTERVAL_SECONDS
         while True:
             self._ensure_open()
             status = _sandbox_status(sandbox)
@@ -241,7 +244,8 @@ class SandboxService:
                     "Sandbox API response did not include a recognized creation status",
                     data=sandbox.raw,
                 )
-            await self._sleep(_READY_POLL_INTERVAL_SECONDS)
+            await self._sleep(interval)
+            interval = min(interval * _READY_POLL_BACKOFF_FACTOR, _READY_POLL_MAX_INTERVAL_SECONDS)
             self._ensure_open()
             sandbox = await self.get_sandbox(
                 name=sandbox.name,
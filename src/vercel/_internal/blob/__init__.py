@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import os
+import re
 import time
 import uuid
 from collections.abc import Callable, Iterable
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Protocol, TypedDict
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
@@ -110,12 +112,13 @@ def get_proxy_through_alternative_api_header_from_env() -> dict[str, str]:
     return headers
 
 
+# The store id is the fourth "_"-separated field: vercel_blob_rw_{storeId}_...
+_STORE_ID_RE = re.compile(r"^[^_]*_[^_]*_[^_]*_([^_]*)")
+
+
 def extract_store_id_from_token(token: str) -> str:
-    try:
-        parts = token.split("_")
-        return parts[3] if len(parts) > 3 else ""
-    except Exception:
-        return ""
+    match = _STORE_ID_RE.match(token)
+    return match.group(1) if match else ""
 
 
 def validate_path(path: str) -> None:
@@ -132,8 +135,9 @@ def validate_path(path: str) -> None:
 
 def validate_access(access: str) -> str:
     from vercel._internal.blob.errors import BlobError
+    from vercel._internal.blob.types import ACCESS_VALUES
 
-    if access not in ("public", "private"):
+    if access not in ACCESS_VALUES:
         raise BlobError('access must be "public" or "private"')
     return access
 
@@ -147,7 +151,13 @@ def construct_blob_url(store_id: str, pathname: str, access: str) -> str:
     # Strip leading slash from pathname
     if pathname.startswith("/"):
         pathname = pathname[1:]
-    return f"https://{store_id}.{access}.blob.vercel-storage.com/{pathname}"
+    return f"{_blob_origin(store_id, access)}/{pathname}"
+
+
+@lru_cache(maxsize=64)
+def _blob_origin(store_id: str, access: str) -> str:
+    # A process talks to a handful of stores, so only the pathname varies per call.
+    return f"https://{store_id}.{access}.blob.vercel-storage.com"
 
 
 def compute_body_length(body: Any) -> int:
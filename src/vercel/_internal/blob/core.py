@@ -6,6 +6,7 @@ import time
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any, Literal, cast
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
@@ -93,6 +94,9 @@ PUT_BODY_OBJECT_ERROR = (
     "Body must be a string, buffer or stream. "
     "You sent a plain object, double check what you're trying to upload."
 )
+# Without a progress callback nothing observes chunk boundaries, so downloads are read in
+# larger pieces to cut per-chunk loop and write overhead.
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 RequestHeadersInput = dict[str, str] | Callable[[int], dict[str, str] | None] | None
 RequestBodyInput = RequestBody | Callable[[int], RequestBody]
 
@@ -410,17 +414,30 @@ def _build_cache_bypass_url(blob_url: str) -> str:
     )
 
 
+@lru_cache(maxsize=1024)
+def _parse_last_modified_header(value: str) -> datetime | None:
+    # Download loops see the same header value over and over; datetimes are
+    # immutable, so the parsed result can be shared between calls.
+    # IMF-fixdate ("Tue, 15 Nov 1994 ...") has its comma at index 3; try the parser that
+    # matches the shape first so the common inputs never raise.
+    parsers = (
+        (parsedate_to_datetime, parse_datetime)
+        if value[3:4] == ","
+        else (parse_datetime, parsedate_to_datetime)
+    )
+    for parser in parsers:
+        try:
+            return parser(value)
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
 def parse_last_modified(value: str | None) -> datetime:
-    if not value:
-        return datetime.now(tz=UTC)
-    try:
-        return parsedate_to_datetime(value)
-    except (ValueError, TypeError):
-        pass
-    try:
-        return parse_datetime(value)
-    except (ValueError, TypeError):
+    parsed = _parse_last_modified_header(value) if value else None
+    if parsed is None:
         return datetime.now(tz=UTC)
+    return parsed
 
 
 class BlobRequestClient:
@@ -710,7 +727,9 @@ class BaseBlobOpsClient:
         self._multipart_client = multipart_client
         self._multipart_runtime = multipart_runtime
 
-    def _stream_download_chunks(self, response: httpx.Response) -> AsyncIterator[bytes]:
+    def _stream_download_chunks(
+        self, response: httpx.Response, chunk_size: int | None
+    ) -> AsyncIterator[bytes]:
         raise NotImplementedError
 
     async def _close_response(self, response: httpx.Response) -> None:
@@ -1130,7 +1149,8 @@ class BaseBlobOpsClient:
             total = int(response.headers.get("Content-Length", "0")) or None
 
             with open(tmp, "wb") as f:
-                async for chunk in self._stream_download_chunks(response):
+                chunk_size = None if progress is not None else _DOWNLOAD_CHUNK_SIZE
+                async for chunk in self._stream_download_chunks(response, chunk_size):
                     if not chunk:
                         continue
                     f.write(chunk)
@@ -1235,9 +1255,11 @@ class SyncBlobOpsClient(BaseBlobOpsClient):
             if next_cursor is None:
                 break
 
-    def _stream_download_chunks(self, response: httpx.Response) -> AsyncIterator[bytes]:
+    def _stream_download_chunks(
+        self, response: httpx.Response, chunk_size: int | None
+    ) -> AsyncIterator[bytes]:
         async def _iterate() -> AsyncIterator[bytes]:
-            for chunk in response.iter_bytes():
+            for chunk in response.iter_bytes(chunk_size):
                 yield chunk
 
         return _iterate()
@@ -1279,9 +1301,11 @@ class AsyncBlobOpsClient(BaseBlobOpsClient):
     def _make_upload_part_fn(self, token: str | None = None) -> Any:
         return lambda **kw: self._multipart_client.upload_part(token=token, **kw)
 
-    def _stream_download_chunks(self, response: httpx.Response) -> AsyncIterator[bytes]:
+    def _stream_download_chunks(
+        self, response: httpx.Response, chunk_size: int | None
+    ) -> AsyncIterator[bytes]:
         async def _iterate() -> AsyncIterator[bytes]:
-            async for chunk in response.aiter_bytes():
+            async for chunk in response.aiter_bytes(chunk_size):
                 yield chunk
 
         return _iterate()
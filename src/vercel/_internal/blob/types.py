@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from typing import Literal, get_args
 
 
 @dataclass(slots=True)
@@ -81,6 +81,7 @@ class MultipartPart:
 
 
 Access = Literal["public", "private"]
+ACCESS_VALUES: tuple[Access, ...] = get_args(Access)
 
 
 @dataclass
@@ -658,6 +658,44 @@ class TestBlobReadAndDownload:
         assert progress_updates[-1] == (len(payload), len(payload))
         assert any(update[0] < len(payload) for update in progress_updates)
 
+    @respx.mock
+    def test_download_file_sync_without_progress_coalesces_chunks(
+        self, mock_env_clear, mock_blob_head_response, tmp_path, monkeypatch
+    ):
+        """Test sync file download without progress reads the body in 64 KiB chunks."""
+        chunks = [b"a" * 40_000, b"b" * 40_000, b"c" * 100]
+        payload = b"".join(chunks)
+        chunk_sizes: list[int | None] = []
+        read_lengths: list[int] = []
+        iter_bytes = httpx.Response.iter_bytes
+
+        def spy_iter_bytes(response, chunk_size=None):
+            chunk_sizes.append(chunk_size)
+            for chunk in iter_bytes(response, chunk_size):
+                read_lengths.append(len(chunk))
+                yield chunk
+
+        monkeypatch.setattr(httpx.Response, "iter_bytes", spy_iter_bytes)
+
+        class ChunkedSyncStream(httpx.SyncByteStream):
+            def __iter__(self):
+                yield from chunks
+
+        route = respx.get(mock_blob_head_response["downloadUrl"]).mock(
+            return_value=httpx.Response(200, stream=ChunkedSyncStream())
+        )
+        destination = tmp_path / "sync-download-coalesced.bin"
+
+        result = download_file(
+            mock_blob_head_response["downloadUrl"], destination, token="test_token"
+        )
+
+        assert route.called
+        assert result == str(destination)
+        assert destination.read_bytes() == payload
+        assert chunk_sizes == [64 * 1024]
+        assert read_lengths == [64 * 1024, len(payload) - 64 * 1024]
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_download_file_async_progress(
@@ -739,6 +777,46 @@ class TestBlobReadAndDownload:
         assert progress_updates[-1] == (len(payload), len(payload))
         assert any(update[0] < len(payload) for update in progress_updates)
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_download_file_async_without_progress_coalesces_chunks(
+        self, mock_env_clear, mock_blob_head_response, tmp_path, monkeypatch
+    ):
+        """Test async file download without progress reads the body in 64 KiB chunks."""
+        chunks = [b"a" * 40_000, b"b" * 40_000, b"c" * 100]
+        payload = b"".join(chunks)
+        chunk_sizes: list[int | None] = []
+        read_lengths: list[int] = []
+        aiter_bytes = httpx.Response.aiter_bytes
+
+        async def spy_aiter_bytes(response, chunk_size=None):
+            chunk_sizes.append(chunk_size)
+            async for chunk in aiter_bytes(response, chunk_size):
+                read_lengths.append(len(chunk))
+                yield chunk
+
+        monkeypatch.setattr(httpx.Response, "aiter_bytes", spy_aiter_bytes)
+
+        class ChunkedAsyncStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for chunk in chunks:
+                    yield chunk
+
+        route = respx.get(mock_blob_head_response["downloadUrl"]).mock(
+            return_value=httpx.Response(200, stream=ChunkedAsyncStream())
+        )
+        destination = tmp_path / "async-download-coalesced.bin"
+
+        result = await download_file_async(
+            mock_blob_head_response["downloadUrl"], destination, token="test_token"
+        )
+
+        assert route.called
+        assert result == str(destination)
+        assert destination.read_bytes() == payload
+        assert chunk_sizes == [64 * 1024]
+        assert read_lengths == [64 * 1024, len(payload) - 64 * 1024]
+
 
 class TestBlobList:
     """Test blob list operations."""
@@ -3,9 +3,16 @@
 Tests environment access, IP/geo extraction, and header context management.
 """
 
+from types import SimpleNamespace
+
 import pytest
 
 
+def _request(headers: dict[str, str] | None = None) -> SimpleNamespace:
+    """Request-like object whose ``headers`` mapping answers ``.get()`` lookups."""
+    return SimpleNamespace(headers=headers or {})
+
+
 class TestGetEnv:
     """Test get_env and Env dataclass."""
 
@@ -119,43 +126,21 @@ class TestIpAddress:
         """Test extracting IP from request-like object."""
         from vercel.functions import ip_address
 
-        class MockHeaders:
-            def get(self, name):
-                if name == "x-real-ip":
-                    return "203.0.113.42"
-                return None
-
-        class MockRequest:
-            headers = MockHeaders()
-
-        ip = ip_address(MockRequest())
+        ip = ip_address(_request({"x-real-ip": "203.0.113.42"}))
         assert ip == "203.0.113.42"
 
     def test_ip_address_from_headers_object(self, mock_env_clear):
         """Test extracting IP from headers-like object."""
         from vercel.functions import ip_address
 
-        class MockHeaders:
-            def get(self, name):
-                if name == "x-real-ip":
-                    return "192.168.1.100"
-                return None
-
-        ip = ip_address(MockHeaders())
+        ip = ip_address({"x-real-ip": "192.168.1.100"})
         assert ip == "192.168.1.100"
 
     def test_ip_address_missing(self, mock_env_clear):
         """Test IP is None when header missing."""
         from vercel.functions import ip_address
 
-        class MockHeaders:
-            def get(self, name):
-                return None
-
-        class MockRequest:
-            headers = MockHeaders()
-
-        ip = ip_address(MockRequest())
+        ip = ip_address(_request())
         assert ip is None
 
 
@@ -176,14 +161,7 @@ class TestGeolocation:
             "x-vercel-id": "iad1::12345",
         }
 
-        class MockHeaders:
-            def get(self, name):
-                return headers_data.get(name)
-
-        class MockRequest:
-            headers = MockHeaders()
-
-        geo = geolocation(MockRequest())
+        geo = geolocation(_request(headers_data))
 
         assert geo["city"] == "San Francisco"  # Decoded
         assert geo["country"] == "US"
@@ -197,16 +175,7 @@ class TestGeolocation:
         """Test country flag emoji generation."""
         from vercel.functions import geolocation
 
-        class MockHeaders:
-            def get(self, name):
-                if name == "x-vercel-ip-country":
-                    return "US"
-                return None
-
-        class MockRequest:
-            headers = MockHeaders()
-
-        geo = geolocation(MockRequest())
+        geo = geolocation(_request({"x-vercel-ip-country": "US"}))
 
         # US flag emoji
         assert geo["flag"] is not None
@@ -216,14 +185,7 @@ class TestGeolocation:
         """Test geolocation with no headers."""
         from vercel.functions import geolocation
 
-        class MockHeaders:
-            def get(self, name):
-                return None
-
-        class MockRequest:
-            headers = MockHeaders()
-
-        geo = geolocation(MockRequest())
+        geo = geolocation(_request())
 
         assert geo["city"] is None
         assert geo["country"] is None
@@ -233,16 +195,7 @@ class TestGeolocation:
         """Test region extraction from request ID."""
         from vercel.functions import geolocation
 
-        class MockHeaders:
-            def get(self, name):
-                if name == "x-vercel-id":
-                    return "sfo1::request-123"
-                return None
-
-        class MockRequest:
-            headers = MockHeaders()
-
-        geo = geolocation(MockRequest())
+        geo = geolocation(_request({"x-vercel-id": "sfo1::request-123"}))
         assert geo["region"] == "sfo1"
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any
 
@@ -85,8 +86,22 @@ GENERATED_ROUTE = GeneratedRoute(
 )
 
 
-def _install_routes() -> dict[str, respx.Route]:
-    list_route = respx.get(
+@pytest.fixture(scope="module")
+def routes_mock() -> Iterator[tuple[respx.MockRouter, dict[str, respx.Route]]]:
+    """Register the project-routes API once for the module; tests only reset call history."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router, _install_routes(router)
+
+
+@pytest.fixture
+def routes(routes_mock: tuple[respx.MockRouter, dict[str, respx.Route]]) -> dict[str, respx.Route]:
+    router, installed = routes_mock
+    router.reset()
+    return installed
+
+
+def _install_routes(router: respx.MockRouter) -> dict[str, respx.Route]:
+    list_route = router.get(
         f"{API_URL}/v1/projects/prj_123/routes",
         params={
             "teamId": "team_123",
@@ -104,20 +119,20 @@ def _install_routes() -> dict[str, respx.Route]:
             },
         )
     )
-    stage_route = respx.put(
+    stage_route = router.put(
         f"{API_URL}/v1/projects/prj_123/routes", params={"teamId": "team_123"}
     ).mock(return_value=httpx.Response(200, json={"version": VERSION_JSON}))
-    add_route = respx.post(
+    add_route = router.post(
         f"{API_URL}/v1/projects/prj_123/routes", params={"teamId": "team_123"}
     ).mock(
         return_value=httpx.Response(
             200, json={"route": PROJECT_ROUTE_JSON, "version": VERSION_JSON}
         )
     )
-    delete_route = respx.delete(
+    delete_route = router.delete(
         f"{API_URL}/v1/projects/prj_123/routes", params={"teamId": "team_123"}
     ).mock(return_value=httpx.Response(200, json={"deletedCount": 1, "version": VERSION_JSON}))
-    edit_route = respx.patch(
+    edit_route = router.patch(
         f"{API_URL}/v1/projects/prj_123/routes/route_123",
         params={"teamId": "team_123"},
     ).mock(
@@ -125,15 +140,15 @@ def _install_routes() -> dict[str, respx.Route]:
             200, json={"route": PROJECT_ROUTE_JSON, "version": VERSION_JSON}
         )
     )
-    generate_route = respx.post(
+    generate_route = router.post(
         f"{API_URL}/v1/projects/prj_123/routes/generate",
         params={"teamId": "team_123"},
     ).mock(return_value=httpx.Response(200, json={"route": GENERATED_ROUTE_JSON}))
-    versions_route = respx.get(
+    versions_route = router.get(
         f"{API_URL}/v1/projects/prj_123/routes/versions",
         params={"teamId": "team_123"},
     ).mock(return_value=httpx.Response(200, json={"versions": [VERSION_JSON]}))
-    update_route = respx.post(
+    update_route = router.post(
         f"{API_URL}/v1/projects/prj_123/routes/versions",
         params={"teamId": "team_123"},
     ).mock(return_value=httpx.Response(200, json={"version": VERSION_JSON}))
@@ -173,9 +188,9 @@ def _assert_requests(routes: dict[str, respx.Route]) -> None:
         assert json.loads(routes[name].calls.last.request.content) == body
 
 
-@respx.mock
-def test_sync_client_supports_every_project_routes_operation() -> None:
-    routes = _install_routes()
+def test_sync_client_supports_every_project_routes_operation(
+    routes: dict[str, respx.Route],
+) -> None:
     client = Vercel(access_token="test-token", base_url=API_URL)
 
     listed = client.project_routes.get_routes(
@@ -240,10 +255,10 @@ def test_sync_client_supports_every_project_routes_operation() -> None:
     _assert_requests(routes)
 
 
-@respx.mock
 @pytest.mark.asyncio
-async def test_async_client_supports_every_project_routes_operation() -> None:
-    routes = _install_routes()
+async def test_async_client_supports_every_project_routes_operation(
+    routes: dict[str, respx.Route],
+) -> None:
     client = AsyncVercel(access_token="test-token", base_url=API_URL)
 
     listed = await client.project_routes.get_routes(
@@ -8,7 +8,9 @@ These tests require real API credentials set via environment variables:
 
 import os
 import uuid
-from collections.abc import Generator
+import warnings
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
@@ -99,6 +101,12 @@ class CleanupRegistry:
         """
         self._cleanups.append((resource_type, resource_id))
 
+    def unregister(self, resource_type: str, resource_id: Any) -> None:
+        """Stop tracking a resource the test has already deleted itself."""
+        self._cleanups = [
+            entry for entry in self._cleanups if entry != (resource_type, resource_id)
+        ]
+
     def get_resources(self, resource_type: str) -> list[Any]:
         """Get all registered resources of a specific type."""
         return [rid for rtype, rid in self._cleanups if rtype == resource_type]
@@ -108,6 +116,62 @@ class CleanupRegistry:
         self._cleanups.clear()
 
 
+def _warn_cleanup_failure(resource_type: str, resource_id: Any, error: Exception) -> None:
+    warnings.warn(
+        f"Live test cleanup failed for {resource_type} {resource_id!r}: {error!r}",
+        stacklevel=2,
+    )
+
+
+def _cleanup_blobs(urls: list[Any]) -> None:
+    try:
+        from vercel.blob import delete
+    except ImportError:
+        return
+
+    blob_token = os.getenv("BLOB_READ_WRITE_TOKEN")
+    if not blob_token:
+        return
+    try:
+        # One batched request; retry per URL only if the batch is rejected.
+        delete(urls, token=blob_token)
+    except Exception:
+        for url in urls:
+            try:
+                delete(url, token=blob_token)
+            except Exception as error:  # Best effort cleanup
+                _warn_cleanup_failure("blob", url, error)
+
+
+def _cleanup_projects(project_ids: list[Any]) -> None:
+    try:
+        from vercel.projects import delete_project
+    except ImportError:
+        return
+
+    vercel_token = os.getenv("VERCEL_TOKEN") or os.getenv("VERCEL_OIDC_TOKEN")
+    team_id = os.getenv("VERCEL_TEAM_ID")
+    if not (vercel_token and team_id):
+        return
+
+    def delete_one(project_id: Any) -> None:
+        try:
+            delete_project(project_id, token=vercel_token, team_id=team_id)
+        except Exception as error:  # Best effort cleanup
+            _warn_cleanup_failure("project", project_id, error)
+
+    # Deletes are independent network waits, so fan them out.
+    with ThreadPoolExecutor(max_workers=min(len(project_ids), 16)) as executor:
+        list(executor.map(delete_one, project_ids))
+
+
+# Cleanup handler per registered resource type; each takes the registered IDs.
+_CLEANUP_HANDLERS: dict[str, Callable[[list[Any]], None]] = {
+    "blob": _cleanup_blobs,
+    "project": _cleanup_projects,
+}
+
+
 @pytest.fixture
 def cleanup_registry() -> Generator[CleanupRegistry, None, None]:
     """Fixture providing a cleanup registry for tracking test resources.
@@ -122,37 +186,9 @@ def cleanup_registry() -> Generator[CleanupRegistry, None, None]:
     registry = CleanupRegistry()
     yield registry
 
-    # Cleanup blob resources
-    blob_urls = registry.get_resources("blob")
-    if blob_urls:
-        try:
-            from vercel.blob import delete
-
-            blob_token = os.getenv("BLOB_READ_WRITE_TOKEN")
-            if blob_token:
-                for url in blob_urls:
-                    try:
-                        delete(url, token=blob_token)
-                    except Exception:
-                        pass  # Best effort cleanup
-        except ImportError:
-            pass
-
-    # Cleanup project resources
-    project_ids = registry.get_resources("project")
-    if project_ids:
-        try:
-            from vercel.projects import delete_project
-
-            vercel_token = os.getenv("VERCEL_TOKEN") or os.getenv("VERCEL_OIDC_TOKEN")
-            team_id = os.getenv("VERCEL_TEAM_ID")
-            if vercel_token and team_id:
-                for project_id in project_ids:
-                    try:
-                        delete_project(project_id, token=vercel_token, team_id=team_id)
-                    except Exception:
-                        pass  # Best effort cleanup
-        except ImportError:
-            pass
+    for resource_type, handler in _CLEANUP_HANDLERS.items():
+        resource_ids = registry.get_resources(resource_type)
+        if resource_ids:
+            handler(resource_ids)
 
     registry.clear()
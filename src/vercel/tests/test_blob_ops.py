@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import get_args
-from unittest.mock import AsyncMock, MagicMock, patch
+import importlib
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, get_args
 
 import pytest
+import time_machine
 
-from vercel._internal.blob import validate_access
-from vercel._internal.blob.core import parse_last_modified
-from vercel._internal.core.iter_coroutine import iter_coroutine
+from vercel._internal.blob import (
+    _blob_origin,
+    construct_blob_url,
+    extract_store_id_from_token,
+    validate_access,
+)
+from vercel._internal.blob.core import _parse_last_modified_header, parse_last_modified
+from vercel._internal.blob.types import ACCESS_VALUES
 from vercel.blob.errors import BlobError
 from vercel.blob.ops import (
     download_file,
@@ -18,38 +25,48 @@ from vercel.blob.ops import (
 )
 
 # Token format: vercel_blob_rw_{storeId}_...
-# extract_store_id_from_token splits on "_" and returns index 3
+# extract_store_id_from_token returns the fourth "_"-separated field
 TOKEN = "vercel_blob_rw_storeid123_token123"
 STORE_ID = "storeid123"
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
 
 # ---------------------------------------------------------------------------
 # parse_last_modified — pure logic
 # ---------------------------------------------------------------------------
 class TestParseLastModified:
-    def test_rfc7231_date(self):
-        dt = parse_last_modified("Tue, 15 Nov 1994 08:12:31 GMT")
-        assert dt == datetime(1994, 11, 15, 8, 12, 31, tzinfo=timezone.utc)
-
-    def test_iso8601_date(self):
-        dt = parse_last_modified("2024-01-15T10:30:00+00:00")
-        assert dt.year == 2024
-        assert dt.month == 1
-        assert dt.day == 15
-        assert dt.hour == 10
-        assert dt.minute == 30
-
-    def test_none_returns_approx_now(self):
-        before = datetime.now(tz=timezone.utc)
-        dt = parse_last_modified(None)
-        after = datetime.now(tz=timezone.utc)
-        assert before <= dt <= after
-
-    def test_invalid_string_returns_approx_now(self):
-        before = datetime.now(tz=timezone.utc)
-        dt = parse_last_modified("not-a-date")
-        after = datetime.now(tz=timezone.utc)
-        assert before <= dt <= after
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (
+                "Tue, 15 Nov 1994 08:12:31 GMT",
+                datetime(1994, 11, 15, 8, 12, 31, tzinfo=timezone.utc),
+            ),
+            ("2024-01-15T10:30:00+00:00", datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)),
+            ("Sun Nov  6 08:49:37 1994", datetime(1994, 11, 6, 8, 49, 37)),
+            (None, NOW),
+            ("not-a-date", NOW),
+        ],
+        ids=["rfc7231", "iso8601", "asctime", "none", "invalid"],
+    )
+    @time_machine.travel(NOW, tick=False)
+    def test_parses_or_falls_back_to_now(self, raw, expected):
+        assert parse_last_modified(raw) == expected
+
+    def test_repeated_header_is_parsed_once(self):
+        _parse_last_modified_header.cache_clear()
+        for _ in range(10_000):
+            parse_last_modified("Wed, 16 Nov 1994 08:12:31 GMT")
+        info = _parse_last_modified_header.cache_info()
+        assert info.misses == 1
+        assert info.hits == 9_999
+
+    def test_invalid_string_is_not_frozen_in_cache(self):
+        with time_machine.travel(NOW, tick=False):
+            first = parse_last_modified("still-not-a-date")
+        with time_machine.travel(NOW + timedelta(seconds=1), tick=False):
+            second = parse_last_modified("still-not-a-date")
+        assert second - first == timedelta(seconds=1)
 
 
 # ---------------------------------------------------------------------------
@@ -67,120 +84,135 @@ class TestValidateAccess:
             validate_access("invalid")  # type: ignore[arg-type]
 
 
+# ---------------------------------------------------------------------------
+# extract_store_id_from_token — pure logic
+# ---------------------------------------------------------------------------
+class TestExtractStoreIdFromToken:
+    @pytest.mark.parametrize(
+        ("token", "expected"),
+        [
+            (TOKEN, STORE_ID),
+            ("vercel_blob_rw_storeid123", STORE_ID),
+            ("vercel_blob_rw__token123", ""),
+            ("short_token", ""),
+            ("", ""),
+        ],
+        ids=["full", "no-secret", "empty-store-id", "short", "empty"],
+    )
+    def test_extracts_fourth_field(self, token, expected):
+        assert extract_store_id_from_token(token) == expected
+
+
+# ---------------------------------------------------------------------------
+# construct_blob_url — pure logic
+# ---------------------------------------------------------------------------
+class TestConstructBlobUrl:
+    @pytest.mark.parametrize("access", ["public", "private"])
+    def test_pathname_access(self, access):
+        url = construct_blob_url(STORE_ID, "/my/file.txt", access)
+        assert url == f"https://{STORE_ID}.{access}.blob.vercel-storage.com/my/file.txt"
+
+    def test_origin_is_reused_across_pathnames(self):
+        _blob_origin.cache_clear()
+        for index in range(10):
+            construct_blob_url(STORE_ID, f"file-{index}.txt", "public")
+        assert _blob_origin.cache_info().hits == 9
+
+
+class _FakeCoreClient:
+    """Records the delegated download call without MagicMock's spec machinery."""
+
+    def __init__(self, result: str) -> None:
+        self.result = result
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self.constructed = 0
+
+    def __call__(self) -> _FakeCoreClient:
+        self.constructed += 1
+        return self
+
+    def __enter__(self) -> _FakeCoreClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    async def __aenter__(self) -> _FakeCoreClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def download_file(self, *args: Any, **kwargs: Any) -> str:
+        self.calls.append((args, kwargs))
+        return self.result
+
+
+@pytest.fixture(scope="module")
+def downloads_dir(tmp_path_factory):
+    """One directory for every download destination; tests only need unique names."""
+    return tmp_path_factory.mktemp("downloads")
+
+
+def _expected_download_call(path: str, dest: str, access: str) -> tuple[Any, ...]:
+    return (
+        (path, dest),
+        {
+            "access": access,
+            "timeout": None,
+            "overwrite": True,
+            "create_parents": True,
+            "progress": None,
+            "token": TOKEN,
+        },
+    )
+
+
 # ---------------------------------------------------------------------------
 # download_file (sync) — wrapper delegation
 # ---------------------------------------------------------------------------
 class TestDownloadFile:
-    def test_pathname_delegates_to_core_client(self, tmp_path):
-        dest = tmp_path / "downloaded.txt"
-        mock_core_client = MagicMock()
-        mock_core_client.download_file = AsyncMock(return_value=str(dest))
-
-        def _run(operation):
-            return iter_coroutine(operation(mock_core_client))
-
-        with patch("vercel.blob.ops._run_sync_blob_operation", side_effect=_run):
-            result = download_file("my/file.txt", str(dest), token=TOKEN, access="public")
-
-        assert result == str(dest)
-        mock_core_client.download_file.assert_awaited_once_with(
-            "my/file.txt",
-            str(dest),
-            access="public",
-            timeout=None,
-            overwrite=True,
-            create_parents=True,
-            progress=None,
-            token=TOKEN,
-        )
-
-    def test_private_access_passes_access_to_core_client(self, tmp_path):
-        dest = tmp_path / "private.txt"
-        mock_core_client = MagicMock()
-        mock_core_client.download_file = AsyncMock(return_value=str(dest))
-
-        def _run(operation):
-            return iter_coroutine(operation(mock_core_client))
-
-        with patch("vercel.blob.ops._run_sync_blob_operation", side_effect=_run):
-            download_file("my/secret.txt", str(dest), token=TOKEN, access="private")
-
-        mock_core_client.download_file.assert_awaited_once_with(
-            "my/secret.txt",
-            str(dest),
-            access="private",
-            timeout=None,
-            overwrite=True,
-            create_parents=True,
-            progress=None,
-            token=TOKEN,
-        )
+    @pytest.mark.parametrize("access", ["public", "private"])
+    def test_pathname_delegates_to_core_client(self, monkeypatch, downloads_dir, request, access):
+        dest = os.fspath(downloads_dir / f"{request.node.name}.txt")
+        fake = _FakeCoreClient(dest)
+        monkeypatch.setattr("vercel.blob.ops.SyncBlobOpsClient", fake)
+
+        result = download_file("my/file.txt", dest, token=TOKEN, access=access)
+
+        assert result == dest
+        assert fake.constructed == 1
+        assert fake.calls == [_expected_download_call("my/file.txt", dest, access)]
 
 
 # ---------------------------------------------------------------------------
 # download_file_async — wrapper delegation
 # ---------------------------------------------------------------------------
 class TestDownloadFileAsync:
-    async def test_pathname_delegates_to_core_client(self, tmp_path):
-        dest = tmp_path / "downloaded_async.txt"
-        mock_core_client = MagicMock()
-        mock_core_client.download_file = AsyncMock(return_value=str(dest))
-        mock_core_client.__aenter__ = AsyncMock(return_value=mock_core_client)
-        mock_core_client.__aexit__ = AsyncMock(return_value=False)
-
-        mock_cls = MagicMock(return_value=mock_core_client)
-        with patch("vercel.blob.ops.AsyncBlobOpsClient", mock_cls):
-            result = await download_file_async(
-                "my/file.txt", str(dest), token=TOKEN, access="public"
-            )
-
-        assert result == str(dest)
-        mock_cls.assert_called_once_with()
-        mock_core_client.download_file.assert_awaited_once_with(
-            "my/file.txt",
-            str(dest),
-            access="public",
-            timeout=None,
-            overwrite=True,
-            create_parents=True,
-            progress=None,
-            token=TOKEN,
-        )
-
-    async def test_private_access_passes_access_to_core_client(self, tmp_path):
-        dest = tmp_path / "private_async.txt"
-        mock_core_client = MagicMock()
-        mock_core_client.download_file = AsyncMock(return_value=str(dest))
-        mock_core_client.__aenter__ = AsyncMock(return_value=mock_core_client)
-        mock_core_client.__aexit__ = AsyncMock(return_value=False)
-
-        mock_cls = MagicMock(return_value=mock_core_client)
-        with patch("vercel.blob.ops.AsyncBlobOpsClient", mock_cls):
-            await download_file_async("my/secret.txt", str(dest), token=TOKEN, access="private")
-
-        mock_cls.assert_called_once_with()
-        mock_core_client.download_file.assert_awaited_once_with(
-            "my/secret.txt",
-            str(dest),
-            access="private",
-            timeout=None,
-            overwrite=True,
-            create_parents=True,
-            progress=None,
-            token=TOKEN,
-        )
+    @pytest.mark.parametrize("access", ["public", "private"])
+    async def test_pathname_delegates_to_core_client(
+        self, monkeypatch, downloads_dir, request, access
+    ):
+        dest = os.fspath(downloads_dir / f"async-{request.node.name}.txt")
+        fake = _FakeCoreClient(dest)
+        monkeypatch.setattr("vercel.blob.ops.AsyncBlobOpsClient", fake)
+
+        result = await download_file_async("my/file.txt", dest, token=TOKEN, access=access)
+
+        assert result == dest
+        assert fake.constructed == 1
+        assert fake.calls == [_expected_download_call("my/file.txt", dest, access)]
 
 
 # ---------------------------------------------------------------------------
 # Access type export
 # ---------------------------------------------------------------------------
 class TestAccessTypeExport:
-    def test_import_from_blob(self):
-        from vercel.blob import Access as BlobAccess
-
-        assert get_args(BlobAccess) == ("public", "private")
+    def test_access_values(self):
+        assert ACCESS_VALUES == ("public", "private")
 
-    def test_import_from_blob_aio(self):
-        from vercel.blob.aio import Access as AioAccess
+    @pytest.mark.parametrize("module_name", ["vercel.blob", "vercel.blob.aio"])
+    def test_access_is_exported(self, module_name):
+        module = importlib.import_module(module_name)
 
-        assert get_args(AioAccess) == ("public", "private")
+        assert get_args(module.Access) == ACCESS_VALUES
@@ -5,28 +5,90 @@ and produce consistent results when given the same inputs.
 """
 
 import inspect
-from collections.abc import Callable
-from typing import Any
-
-
-def get_param_names(func: Callable) -> list[str]:
-    """Extract parameter names from a function signature."""
-    sig = inspect.signature(func)
-    return [
+from collections.abc import AsyncIterator, Callable, Iterator
+from functools import cache
+from typing import Any, get_args, get_origin, get_type_hints
+
+import pytest
+
+from vercel.blob import (
+    AsyncBlobClient,
+    BlobClient,
+    complete_multipart_upload,
+    complete_multipart_upload_async,
+    copy,
+    copy_async,
+    create_folder,
+    create_folder_async,
+    create_multipart_upload,
+    create_multipart_upload_async,
+    create_multipart_uploader,
+    create_multipart_uploader_async,
+    delete,
+    delete_async,
+    download_file,
+    download_file_async,
+    head,
+    head_async,
+    iter_objects,
+    iter_objects_async,
+    list_objects,
+    list_objects_async,
+    put,
+    put_async,
+    upload_file,
+    upload_file_async,
+    upload_part,
+    upload_part_async,
+)
+from vercel.blob.types import HeadBlobResult, ListBlobResult, PutBlobResult
+from vercel.cache import AsyncRuntimeCache, RuntimeCache
+from vercel.projects import create_project, delete_project, get_projects, update_project
+from vercel.projects.projects import (
+    create_project_async,
+    delete_project_async,
+    get_projects_async,
+    update_project_async,
+)
+
+
+@cache
+def _signature(func: Callable) -> inspect.Signature:
+    """Introspect each function once; several tests inspect the same callables."""
+    return inspect.signature(func)
+
+
+@cache
+def _return_type(func: Callable) -> Any:
+    """Resolved return annotation; only the return hint is needed, not the full signature."""
+    return get_type_hints(func)["return"]
+
+
+@cache
+def _public_callables(cls: type) -> frozenset[str]:
+    """Public callable attribute names of a class, scanned once per class.
+
+    Reads each class ``__dict__`` along the MRO so descriptors are never invoked.
+    """
+    return frozenset(
         name
-        for name, param in sig.parameters.items()
-        if param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
-    ]
+        for base in cls.__mro__
+        for name, value in vars(base).items()
+        if not name.startswith("_")
+        and (isinstance(value, (classmethod, staticmethod)) or callable(value))
+    )
 
 
-def get_param_defaults(func: Callable) -> dict[str, Any]:
-    """Extract parameter defaults from a function signature."""
-    sig = inspect.signature(func)
-    return {
-        name: param.default
-        for name, param in sig.parameters.items()
-        if param.default is not inspect.Parameter.empty
-    }
+def get_params(func: Callable) -> tuple[list[str], dict[str, Any]]:
+    """Extract parameter names and defaults from a function signature in one pass."""
+    names: list[str] = []
+    defaults: dict[str, Any] = {}
+    for name, param in _signature(func).parameters.items():
+        if param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            names.append(name)
+        if param.default is not inspect.Parameter.empty:
+            defaults[name] = param.default
+    return names, defaults
 
 
 def compare_signatures(sync_func: Callable, async_func: Callable) -> list[str]:
@@ -36,122 +98,58 @@ def compare_signatures(sync_func: Callable, async_func: Callable) -> list[str]:
     """
     differences = []
 
-    sync_params = get_param_names(sync_func)
-    async_params = get_param_names(async_func)
+    sync_params, sync_defaults = get_params(sync_func)
+    async_params, async_defaults = get_params(async_func)
 
     if sync_params != async_params:
         differences.append(f"Parameter names differ: sync={sync_params}, async={async_params}")
 
-    sync_defaults = get_param_defaults(sync_func)
-    async_defaults = get_param_defaults(async_func)
-
     # Check that defaults match for common parameters
-    for name in set(sync_defaults.keys()) & set(async_defaults.keys()):
-        if sync_defaults[name] != async_defaults[name]:
+    for name, sync_default in sync_defaults.items():
+        if name in async_defaults and sync_default != async_defaults[name]:
             differences.append(
-                f"Default for '{name}' differs: "
-                f"sync={sync_defaults[name]}, async={async_defaults[name]}"
+                f"Default for '{name}' differs: sync={sync_default}, async={async_defaults[name]}"
             )
 
     return differences
 
 
-class TestBlobSignatureParity:
-    """Test blob module sync/async signature parity."""
-
-    def test_put_signatures_match(self):
-        """Test put and put_async have matching signatures."""
-        from vercel.blob import put, put_async
-
-        differences = compare_signatures(put, put_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_delete_signatures_match(self):
-        """Test delete and delete_async have matching signatures."""
-        from vercel.blob import delete, delete_async
-
-        differences = compare_signatures(delete, delete_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_head_signatures_match(self):
-        """Test head and head_async have matching signatures."""
-        from vercel.blob import head, head_async
-
-        differences = compare_signatures(head, head_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_list_objects_signatures_match(self):
-        """Test list_objects and list_objects_async have matching signatures."""
-        from vercel.blob import list_objects, list_objects_async
-
-        differences = compare_signatures(list_objects, list_objects_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_iter_objects_signatures_match(self):
-        """Test iter_objects and iter_objects_async have matching signatures."""
-        from vercel.blob import iter_objects, iter_objects_async
-
-        differences = compare_signatures(iter_objects, iter_objects_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_copy_signatures_match(self):
-        """Test copy and copy_async have matching signatures."""
-        from vercel.blob import copy, copy_async
-
-        differences = compare_signatures(copy, copy_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_create_folder_signatures_match(self):
-        """Test create_folder and create_folder_async have matching signatures."""
-        from vercel.blob import create_folder, create_folder_async
-
-        differences = compare_signatures(create_folder, create_folder_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_upload_file_signatures_match(self):
-        """Test upload_file and upload_file_async have matching signatures."""
-        from vercel.blob import upload_file, upload_file_async
-
-        differences = compare_signatures(upload_file, upload_file_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_download_file_signatures_match(self):
-        """Test download_file and download_file_async have matching signatures."""
-        from vercel.blob import download_file, download_file_async
-
-        differences = compare_signatures(download_file, download_file_async)
-        assert not differences, f"Signature differences: {differences}"
-
-
-class TestBlobMultipartSignatureParity:
-    """Test blob multipart sync/async signature parity."""
-
-    def test_create_multipart_upload_signatures_match(self):
-        """Test create_multipart_upload signatures match."""
-        from vercel.blob import create_multipart_upload, create_multipart_upload_async
-
-        differences = compare_signatures(create_multipart_upload, create_multipart_upload_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_upload_part_signatures_match(self):
-        """Test upload_part signatures match."""
-        from vercel.blob import upload_part, upload_part_async
-
-        differences = compare_signatures(upload_part, upload_part_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_complete_multipart_upload_signatures_match(self):
-        """Test complete_multipart_upload signatures match."""
-        from vercel.blob import complete_multipart_upload, complete_multipart_upload_async
-
-        differences = compare_signatures(complete_multipart_upload, complete_multipart_upload_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_create_multipart_uploader_signatures_match(self):
-        """Test create_multipart_uploader signatures match."""
-        from vercel.blob import create_multipart_uploader, create_multipart_uploader_async
-
-        differences = compare_signatures(create_multipart_uploader, create_multipart_uploader_async)
+SIGNATURE_PAIRS = [
+    # Blob operations
+    pytest.param(put, put_async, id="put"),
+    pytest.param(delete, delete_async, id="delete"),
+    pytest.param(head, head_async, id="head"),
+    pytest.param(list_objects, list_objects_async, id="list_objects"),
+    pytest.param(iter_objects, iter_objects_async, id="iter_objects"),
+    pytest.param(copy, copy_async, id="copy"),
+    pytest.param(create_folder, create_folder_async, id="create_folder"),
+    pytest.param(upload_file, upload_file_async, id="upload_file"),
+    pytest.param(download_file, download_file_async, id="download_file"),
+    # Blob multipart
+    pytest.param(
+        create_multipart_upload, create_multipart_upload_async, id="create_multipart_upload"
+    ),
+    pytest.param(upload_part, upload_part_async, id="upload_part"),
+    pytest.param(
+        complete_multipart_upload, complete_multipart_upload_async, id="complete_multipart_upload"
+    ),
+    pytest.param(
+        create_multipart_uploader, create_multipart_uploader_async, id="create_multipart_uploader"
+    ),
+    # Projects
+    pytest.param(get_projects, get_projects_async, id="get_projects"),
+    pytest.param(create_project, create_project_async, id="create_project"),
+    pytest.param(update_project, update_project_async, id="update_project"),
+    pytest.param(delete_project, delete_project_async, id="delete_project"),
+]
+
+
+class TestSignatureParity:
+    """Test that sync/async function pairs have matching signatures."""
+
+    @pytest.mark.parametrize(("sync_func", "async_func"), SIGNATURE_PAIRS)
+    def test_signatures_match(self, sync_func, async_func):
+        differences = compare_signatures(sync_func, async_func)
         assert not differences, f"Signature differences: {differences}"
 
 
@@ -160,16 +158,8 @@ class TestBlobClientClassParity:
 
     def test_client_methods_exist(self):
         """Test that both client classes have the same methods."""
-        from vercel.blob import AsyncBlobClient, BlobClient
-
-        sync_methods = {
-            m for m in dir(BlobClient) if not m.startswith("_") and callable(getattr(BlobClient, m))
-        }
-        async_methods = {
-            m
-            for m in dir(AsyncBlobClient)
-            if not m.startswith("_") and callable(getattr(AsyncBlobClient, m))
-        }
+        sync_methods = set(_public_callables(BlobClient))
+        async_methods = set(_public_callables(AsyncBlobClient))
 
         # Lifecycle naming intentionally differs by runtime.
         assert "close" in sync_methods
@@ -188,21 +178,11 @@ class TestCacheClassParity:
 
     def test_cache_methods_exist(self):
         """Test that cache classes have equivalent methods."""
-        from vercel.cache import AsyncRuntimeCache, RuntimeCache
-
         # Core methods that should exist in both
         expected_methods = {"get", "set", "delete", "expire_tag"}
 
-        sync_methods = {
-            m
-            for m in dir(RuntimeCache)
-            if not m.startswith("_") and callable(getattr(RuntimeCache, m))
-        }
-        async_methods = {
-            m
-            for m in dir(AsyncRuntimeCache)
-            if not m.startswith("_") and callable(getattr(AsyncRuntimeCache, m))
-        }
+        sync_methods = _public_callables(RuntimeCache)
+        async_methods = _public_callables(AsyncRuntimeCache)
 
         assert expected_methods.issubset(sync_methods), (
             f"Missing sync methods: {expected_methods - sync_methods}"
@@ -212,100 +192,33 @@ class TestCacheClassParity:
         )
 
 
-class TestProjectsSignatureParity:
-    """Test projects module sync/async signature parity."""
-
-    def test_get_projects_signatures_match(self):
-        """Test get_projects and get_projects_async have matching signatures."""
-        from vercel.projects import get_projects
-        from vercel.projects.projects import get_projects_async
-
-        differences = compare_signatures(get_projects, get_projects_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_create_project_signatures_match(self):
-        """Test create_project and create_project_async have matching signatures."""
-        from vercel.projects import create_project
-        from vercel.projects.projects import create_project_async
-
-        differences = compare_signatures(create_project, create_project_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_update_project_signatures_match(self):
-        """Test update_project and update_project_async have matching signatures."""
-        from vercel.projects import update_project
-        from vercel.projects.projects import update_project_async
-
-        differences = compare_signatures(update_project, update_project_async)
-        assert not differences, f"Signature differences: {differences}"
-
-    def test_delete_project_signatures_match(self):
-        """Test delete_project and delete_project_async have matching signatures."""
-        from vercel.projects import delete_project
-        from vercel.projects.projects import delete_project_async
-
-        differences = compare_signatures(delete_project, delete_project_async)
-        assert not differences, f"Signature differences: {differences}"
-
-
 class TestResultTypeParity:
     """Test that sync and async functions return the same result types."""
 
     def test_blob_put_returns_same_type(self):
         """Test put and put_async return the same result type."""
-        from vercel.blob import put, put_async
-        from vercel.blob.types import PutBlobResult
-
-        sync_annotation = inspect.signature(put).return_annotation
-        async_annotation = inspect.signature(put_async).return_annotation
-
-        # Sync should return PutBlobResult directly
-        assert sync_annotation == PutBlobResult or "PutBlobResult" in str(sync_annotation)
-
-        # Async should return Coroutine[..., PutBlobResult] - verify inner type matches
-        async_str = str(async_annotation)
-        assert "PutBlobResult" in async_str, f"Async should return PutBlobResult, got {async_str}"
+        assert _return_type(put) is PutBlobResult
+        assert _return_type(put_async) is PutBlobResult
 
     def test_blob_head_returns_same_type(self):
         """Test head and head_async return the same result type."""
-        from vercel.blob import head, head_async
-        from vercel.blob.types import HeadBlobResult
-
-        sync_annotation = inspect.signature(head).return_annotation
-        async_annotation = inspect.signature(head_async).return_annotation
-
-        # Sync should return HeadBlobResult directly
-        assert sync_annotation == HeadBlobResult or "HeadBlobResult" in str(sync_annotation)
-
-        # Async should return Coroutine[..., HeadBlobResult] - verify inner type matches
-        async_str = str(async_annotation)
-        assert "HeadBlobResult" in async_str, f"Async should return HeadBlobResult, got {async_str}"
+        assert _return_type(head) is HeadBlobResult
+        assert _return_type(head_async) is HeadBlobResult
 
     def test_blob_list_returns_same_type(self):
         """Test list_objects and list_objects_async return the same result type."""
-        from vercel.blob import list_objects, list_objects_async
-        from vercel.blob.types import ListBlobResult
-
-        sync_annotation = inspect.signature(list_objects).return_annotation
-        async_annotation = inspect.signature(list_objects_async).return_annotation
-
-        # Sync should return ListBlobResult directly
-        assert sync_annotation == ListBlobResult or "ListBlobResult" in str(sync_annotation)
-
-        # Async should return Coroutine[..., ListBlobResult] - verify inner type matches
-        async_str = str(async_annotation)
-        assert "ListBlobResult" in async_str, f"Async should return ListBlobResult, got {async_str}"
+        assert _return_type(list_objects) is ListBlobResult
+        assert _return_type(list_objects_async) is ListBlobResult
 
     def test_blob_iter_returns_iterator_types(self):
         """Test iter_objects and iter_objects_async expose iterator return types."""
-        from vercel.blob import iter_objects, iter_objects_async
-
-        sync_annotation = inspect.signature(iter_objects).return_annotation
-        async_annotation = inspect.signature(iter_objects_async).return_annotation
+        sync_annotation = _return_type(iter_objects)
+        async_annotation = _return_type(iter_objects_async)
 
-        assert "Iterator" in str(sync_annotation), (
+        assert get_origin(sync_annotation) is Iterator, (
             f"Sync should return Iterator, got {sync_annotation}"
         )
-        assert "AsyncIterator" in str(async_annotation), (
+        assert get_origin(async_annotation) is AsyncIterator, (
             f"Async should return AsyncIterator, got {async_annotation}"
         )
+        assert get_args(sync_annotation) == get_args(async_annotation)
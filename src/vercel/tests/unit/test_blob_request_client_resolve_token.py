@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
 from vercel._internal.blob.core import BlobRequestClient, _add_authorization_header
+from vercel._internal.core.http.retry import RetryPolicy
 
 TOKEN = "test_token_123"
 PROVIDER_TOKEN = "provider_token_456"
@@ -18,12 +20,11 @@ def _make_request_client(
     token_provider: AsyncMock | None = None,
 ) -> tuple[BlobRequestClient, AsyncMock, AsyncMock]:
     send = AsyncMock(return_value=httpx.Response(200, json={"pathname": "test.txt"}))
-    mock_transport = Mock()
-    mock_transport.send = send
+    transport = SimpleNamespace(send=send)
     provider = token_provider or AsyncMock(return_value=PROVIDER_TOKEN)
     client = BlobRequestClient(
-        transport=mock_transport,
-        retry=MagicMock(
+        transport=transport,  # type: ignore[arg-type]
+        retry=RetryPolicy(
             retries=0,
             backoff_base=0,
             backoff_max=0,
@@ -4,81 +4,46 @@ Unit tests for client class instantiation.
 These tests verify that client classes can be instantiated without errors.
 """
 
-import os
-from unittest.mock import patch
-
 import pytest
 
+from vercel.cache.cache_build import AsyncBuildCache, BuildCache
+from vercel.deployments.client import AsyncDeploymentsClient, DeploymentsClient
+from vercel.projects.client import AsyncProjectsClient, ProjectsClient
+
+API_CLIENTS = [
+    pytest.param(ProjectsClient, id="ProjectsClient"),
+    pytest.param(AsyncProjectsClient, id="AsyncProjectsClient"),
+    pytest.param(DeploymentsClient, id="DeploymentsClient"),
+    pytest.param(AsyncDeploymentsClient, id="AsyncDeploymentsClient"),
+]
+
 
 class TestClientInstantiation:
     """Test that all client classes can be instantiated."""
 
     @pytest.fixture
-    def mock_env_token(self):
+    def mock_env_token(self, monkeypatch):
         """Provide a mock token via environment variable."""
-        with patch.dict(os.environ, {"VERCEL_TOKEN": "test_token"}):
-            yield
-
-    def test_projects_client_instantiation(self, mock_env_token):
-        """Test ProjectsClient can be instantiated."""
-        from vercel.projects.client import ProjectsClient
+        monkeypatch.setenv("VERCEL_TOKEN", "test_token")
 
-        client = ProjectsClient()
+    @pytest.mark.parametrize("client_cls", API_CLIENTS)
+    def test_api_client_instantiation(self, mock_env_token, client_cls):
+        """Test API clients can be instantiated with the token from the environment."""
+        client = client_cls()
         assert client is not None
         assert hasattr(client, "_access_token")
         assert hasattr(client, "_base_url")
         assert hasattr(client, "_timeout")
 
-    def test_projects_client_with_token(self):
-        """Test ProjectsClient can be instantiated with explicit token."""
-        from vercel.projects.client import ProjectsClient
-
-        client = ProjectsClient(access_token="explicit_token")
+    @pytest.mark.parametrize("client_cls", [ProjectsClient, DeploymentsClient])
+    def test_api_client_with_token(self, client_cls):
+        """Test API clients can be instantiated with explicit token."""
+        client = client_cls(access_token="explicit_token")
         assert client is not None
         assert client._access_token == "explicit_token"
 
-    def test_async_projects_client_instantiation(self, mock_env_token):
-        """Test AsyncProjectsClient can be instantiated."""
-        from vercel.projects.client import AsyncProjectsClient
-
-        client = AsyncProjectsClient()
-        assert client is not None
-        assert hasattr(client, "_access_token")
-        assert hasattr(client, "_base_url")
-        assert hasattr(client, "_timeout")
-
-    def test_deployments_client_instantiation(self, mock_env_token):
-        """Test DeploymentsClient can be instantiated."""
-        from vercel.deployments.client import DeploymentsClient
-
-        client = DeploymentsClient()
-        assert client is not None
-        assert hasattr(client, "_access_token")
-        assert hasattr(client, "_base_url")
-        assert hasattr(client, "_timeout")
-
-    def test_deployments_client_with_token(self):
-        """Test DeploymentsClient can be instantiated with explicit token."""
-        from vercel.deployments.client import DeploymentsClient
-
-        client = DeploymentsClient(access_token="explicit_token")
-        assert client is not None
-        assert client._access_token == "explicit_token"
-
-    def test_async_deployments_client_instantiation(self, mock_env_token):
-        """Test AsyncDeploymentsClient can be instantiated."""
-        from vercel.deployments.client import AsyncDeploymentsClient
-
-        client = AsyncDeploymentsClient()
-        assert client is not None
-        assert hasattr(client, "_access_token")
-        assert hasattr(client, "_base_url")
-        assert hasattr(client, "_timeout")
-
     def test_build_cache_instantiation(self):
         """Test BuildCache can be instantiated."""
-        from vercel.cache.cache_build import BuildCache
-
         client = BuildCache(
             endpoint="https://cache.example.com",
             headers={"Authorization": "Bearer test"},
@@ -90,8 +55,6 @@ class TestClientInstantiation:
 
     def test_async_build_cache_instantiation(self):
         """Test AsyncBuildCache can be instantiated."""
-        from vercel.cache.cache_build import AsyncBuildCache
-
         client = AsyncBuildCache(
             endpoint="https://cache.example.com",
             headers={"Authorization": "Bearer test"},